@@ -1,34 +1,49 @@
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import requests
-import pandas as pd
 from datetime import datetime, timedelta
 import random
 import json
+import heapq
+import string
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
 from streamlit_lottie import st_lottie
 import base64
 import os
-from streamlit_elements import elements, mui, html
+from pathlib import Path
 import numpy as np
-import joblib
 import logging
-import folium
-from fpdf import FPDF
-from streamlit_folium import st_folium
-from dotenv import load_dotenv
 import io
-from reportlab.lib.pagesizes import letter
-from reportlab.lib import colors
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from translations import load_translations 
+from translations import join_labels, translate
+from scoring import score_places
 
+@st.cache_data(show_spinner=False, max_entries=64)
 def get_image_base64(image_path):
-    """Convert local image to Base64 format."""
+    """Convert local image to Base64 format (cached per path)."""
     if os.path.exists(image_path):
         with open(image_path, "rb") as img_file:
             return base64.b64encode(img_file.read()).decode()
     return None
+
+# Share one HTTP session across reruns so API calls reuse keep-alive connections
+@st.cache_resource
+def get_http_session():
+    return requests.Session()
+
+def card_grid(cards, min_width="220px"):
+    """Wrap card HTML snippets in a responsive CSS grid so they render as one element."""
+    # Cards are stripped and joined without blank lines so markdown keeps them in one HTML block
+    return (
+        f'<div style="display: grid; grid-template-columns: repeat(auto-fit, minmax({min_width}, 1fr)); gap: 1rem;">\n'
+        + "\n".join(card.strip() for card in cards)
+        + "\n</div>"
+    )
+
+@st.cache_data(show_spinner=False)
+def sidebar_footer_html():
+    """Sidebar footer markup, read once from static/footer.html."""
+    return (Path(__file__).parent / "static" / "footer.html").read_text(encoding="utf-8")
 GOOGLE_MAPS_API_KEY = os.getenv("GOOGLE_MAPS_API_KEY")
 OPENWEATHER_API_KEY = os.getenv("OPENWEATHER_API_KEY")
 
@@ -109,6 +124,13 @@ city_data = {
     }
 }
 
+# Pre-encode every city image once; pages look images up instead of reading files while rendering
+@st.cache_resource(show_spinner=False)
+def _preload_city_images():
+    return {city: get_image_base64(os.path.join("images", info["image"])) for city, info in city_data.items()}
+
+CITY_IMAGE_B64 = _preload_city_images()
+
 LANGUAGES = {
         "English": "en",
         "ಕನ್ನಡ (Kannada)": "kn",
@@ -121,31 +143,100 @@ LANGUAGES = {
         "ગુજરાતી (Gujarati)": "gu",
         "मराठी (Marathi)": "mr"
     }
-#-----------------------------translation--------------------------------
-# Function to load translations
-
-
-# Load translations
-translations = load_translations()
-
-
-
-    # Default to English for untranslated languages
-for lang_code in ["en", "hi"]:  # Add more language codes if needed
-        if lang_code not in translations:
-            translations[lang_code] = translations["en"].copy()
-
-for lang_code in LANGUAGES.values():
-            if lang_code != "en" and lang_code not in translations:
-                translations[lang_code] = translations["en"].copy()
-        
-
+# Trip-type multipliers used when scoring recommended places
+TRIP_TYPE_WEIGHTS = {"Adventure": 1.2, "Relaxation": 0.8, "Cultural": 1.5}
+# Marker colors for itinerary days on the map
+DAY_COLORS = ("blue", "green", "purple", "orange", "#5b396b")
+# Categorize places based on types
+PLACE_TYPE_CATEGORIES = MappingProxyType({
+    "park": "outdoor",
+    "museum": "indoor",
+    "art_gallery": "indoor",
+    "restaurant": "dining",
+    "cafe": "dining",
+    "bar": "dining",
+    "amusement_park": "outdoor",
+    "zoo": "outdoor",
+    "shopping_mall": "indoor",
+    "point_of_interest": "mixed",
+    "establishment": "mixed",
+})
+# Leaflet callback used by FastMarkerCluster: each row is [lat, lng, popup text]
+PLACE_MARKER_CALLBACK = """
+function (row) {
+    var marker = L.marker(new L.LatLng(row[0], row[1]));
+    marker.bindPopup(row[2]);
+    return marker;
+}
+"""
+# Marker icon styles by role; folium attaches each Icon to a single marker, so icon_for builds a fresh one per use
+MARKER_ICONS = MappingProxyType({
+    "destination": MappingProxyType({"color": "red", "icon": "info-sign"}),
+    "user": MappingProxyType({"color": "green", "icon": "home"}),
+})
+# Google Distance Matrix endpoint used for travel times
+DISTANCE_MATRIX_URL = "https://maps.googleapis.com/maps/api/distancematrix/json"
+DISTANCE_MATRIX_BATCH_SIZE = 25  # API limit for destinations per request
+# Featured itineraries and travel guides shown on the Trip Ideas page (translated at render time)
+ITINERARIES = (
+    MappingProxyType({
+        "title": "South India Cultural Tour",
+        "duration": "7 days",
+        "cities": ("Chennai", "Mysuru", "Bengaluru"),
+        "description": "Experience the rich cultural heritage of South India through its temples, palaces, and vibrant traditions.",
+        "highlight": "Mysore Palace light show"
+    }),
+    MappingProxyType({
+        "title": "Coastal Getaway",
+        "duration": "5 days",
+        "cities": ("Chennai", "Pondicherry"),
+        "description": "Relax on beautiful beaches and explore charming coastal towns with French colonial influence.",
+        "highlight": "Sunrise at Promenade Beach in Pondicherry"
+    }),
+    MappingProxyType({
+        "title": "Weekend City Break",
+        "duration": "3 days",
+        "cities": ("Bengaluru",),
+        "description": "Explore the Garden City with its parks, microbreweries, and vibrant tech culture.",
+        "highlight": "Bangalore Palace tour"
+    }),
+)
+GUIDES = (
+    MappingProxyType({"title": "First-Time Visitor's Guide to South India", "type": "PDF Guide",
+     "link": "https://drive.google.com/file/d/1p03M0hbZOL7W5AlmF4IfVdGQOr26iUxb/view?usp=sharing"}),
+    MappingProxyType({"title": "South Indian Cuisine: What to Try Where", "type": "Food Guide",
+     "link": "https://drive.google.com/file/d/1Zp3Lam2U0rjxZfw2pwqi5Oqd9o-knLro/view?usp=sharing"}),
+    MappingProxyType({"title": "Navigating Public Transportation", "type": "Travel Tips",
+     "link": "https://drive.google.com/file/d/1HqpqoR7LISyQ2VMFuq09nzbK8ho9Ej0Q/view?usp=sharing"}),
+    MappingProxyType({"title": "Cultural Etiquette in South India", "type": "Cultural Guide",
+     "link": "https://drive.google.com/file/d/1aabpGkCMOAVXx3mfDiqkTXJkYQO4ZO8a/view?usp=sharing"}),
+)
+# Card markup for the Trip Ideas city grids, filled in per city
+NEARBY_CITY_CARD = string.Template("""
+<div style="background-color: #1E1E1E; padding: 1.2rem; border-radius: 8px;
+margin-bottom: 1.5rem; box-shadow: 0 4px 8px rgba(0,0,0,0.3);
+border-left: 4px solid #9575CD;">
+<img src="data:image/jpeg;base64,$image" width="100%" style="border-radius: 8px; margin-bottom: 10px;">
+<h3 style="color: #FFFFFF; margin-top: 0;">$city</h3>
+<p style="font-size: 0.9rem; color: #E0E0E0;">$significance...</p>
+<p style="font-size: 0.8rem; color: #E0E0E0;"><strong>$attraction_label:</strong> $attraction</p>
+</div>
+""")
+SEASONAL_CITY_CARD = string.Template("""
+<div style="background-color: #1E1E1E; padding: 1.2rem; border-radius: 8px;
+margin-bottom: 1.5rem; box-shadow: 0 4px 8px rgba(0,0,0,0.3);
+border-left: 4px solid #9575CD;">
+<img src="data:image/jpeg;base64,$image" width="100%" style="border-radius: 8px;">
+<h3 style="color: #FFFFFF;">$city</h3>
+<p style="color: #E0E0E0;">$season_label $reason.</p>
+<p style="font-size: 0.8rem; color: #E0E0E0;">$info</p>
+</div>
+""")
 
+#-----------------------------translation--------------------------------
 def translate_text(text_key, lang_code="en"):
-        translations = load_translations()
-        if lang_code in translations and text_key in translations[lang_code]:
-            return translations[lang_code][text_key]
-        return translations["en"].get(text_key, text_key)
+        # Memoized per (key, language) for the life of the process
+        return translate(text_key, lang_code)
                 
 # Function to generate mock itinerary
 def generate_itinerary(city, days):
@@ -281,7 +372,10 @@ st.markdown("""
 
 # Function to load Lottie animation
 def load_lottie_url(url):
-    response = requests.get(url)
+    try:
+        response = get_http_session().get(url, timeout=5)
+    except requests.RequestException:
+        return None
     if response.status_code != 200:
         return None
     return json.loads(response.text)
@@ -451,8 +545,7 @@ if "🏠 HOME" in page:
     for i, city in enumerate(cities):         
         if i < len(cols):            
             with cols[i]:                 
-                image_path = f"images/{city}.jpg"
-                image_base64 = get_image_base64(image_path)
+                image_base64 = CITY_IMAGE_B64.get(city)
                 image_src = f"data:image/jpeg;base64,{image_base64}" if image_base64 else "https://via.placeholder.com/300x200.png?text=No+Image"
                 top_attraction_label = t("top_attraction")
                 st.markdown(f"""
@@ -490,7 +583,7 @@ if "🏠 HOME" in page:
             """, unsafe_allow_html=True)
             
             local_cuisine_label = t("local_cuisine")
-            local_foods = ", ".join(city_info["local_dishes"])
+            local_foods = join_labels(tuple(city_info["local_dishes"]))
             st.markdown(f"""
             <div style="margin-top: 1rem;">
                 <strong>{local_cuisine_label}</strong> {local_foods}
@@ -667,6 +760,16 @@ if "🏠 HOME" in page:
 
 # ------------- PLAN YOUR TRIP PAGE -------------------
 elif page == "✈️ PLAN YOUR TRIP":
+    # Mapping, dataframe and PDF libraries are only needed here, so other pages skip importing them
+    import pandas as pd
+    import folium
+    from folium.plugins import FastMarkerCluster
+    from dotenv import load_dotenv
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib import colors
+    from reportlab.lib.units import inch
+    from reportlab.lib.utils import simpleSplit
+    from reportlab.pdfgen import canvas
 
     # Set up logging (optional, for debugging)
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -700,11 +803,11 @@ elif page == "✈️ PLAN YOUR TRIP":
     
 
     # Fetch coordinates for a city
-    @st.cache_data(ttl=6400)
+    @st.cache_data(ttl=6400, show_spinner=False)
     def get_coordinates(city, api_key=GOOGLE_MAPS_API_KEY):
         url = f"https://maps.googleapis.com/maps/api/geocode/json?address={city}&key={api_key}"
         try:
-            response = requests.get(url)
+            response = get_http_session().get(url, timeout=10)
             data = response.json()
             if data["status"] == "OK" and data["results"]:
                 location = data["results"][0]["geometry"]["location"]
@@ -723,7 +826,7 @@ elif page == "✈️ PLAN YOUR TRIP":
             return None, None
         url = f"https://maps.googleapis.com/maps/api/geocode/json?address={user_location}&key={api_key}"
         try:
-            response = requests.get(url)
+            response = get_http_session().get(url, timeout=10)
             data = response.json()
             if data["status"] == "OK" and data["results"]:
                 location = data["results"][0]["geometry"]["location"]
@@ -736,11 +839,11 @@ elif page == "✈️ PLAN YOUR TRIP":
             return None, None
 
     # Fetch nearby places
-    @st.cache_data(ttl=3600)
+    @st.cache_data(ttl=3600, show_spinner=False)
     def get_nearby_places_cached(lat, lng, radius=5000, api_key=GOOGLE_MAPS_API_KEY):
         url = f"https://maps.googleapis.com/maps/api/place/nearbysearch/json?location={lat},{lng}&radius={radius}&type=tourist_attraction&key={api_key}"
         try:
-            response = requests.get(url)
+            response = get_http_session().get(url, timeout=10)
             data = response.json()
             if data["status"] == "OK":
                 places = data["results"]
@@ -766,7 +869,7 @@ elif page == "✈️ PLAN YOUR TRIP":
     def get_weather_data_cached(city, api_key=OPENWEATHER_API_KEY):
         try:
             url = f"http://api.openweathermap.org/data/2.5/weather?q={city}&appid={api_key}&units=metric"
-            response = requests.get(url)
+            response = get_http_session().get(url, timeout=10)
             data = response.json()
             if response.status_code == 200 and "main" in data and "weather" in data:
                 temp = data["main"]["temp"]
@@ -783,71 +886,70 @@ elif page == "✈️ PLAN YOUR TRIP":
             logger.error(f"Error fetching weather for {city}: {str(e)}")
             return {"condition": "error", "temp": 25, "quality": 5}
 
-    # Fetch traffic data
-    @st.cache_data(ttl=600)
-    def get_traffic_data_for_places_cached(origin_lat, origin_lng, places, api_key=GOOGLE_MAPS_API_KEY):
-        traffic_data = {}
-        default_count = 0
-        for place in places:
+    # Build a fresh folium Icon for a marker role
+    def icon_for(role):
+        return folium.Icon(**MARKER_ICONS[role])
+
+    # Build a lightweight, hashable cache key for a list of places
+    def places_cache_key(places):
+        return tuple((place["name"], round(place["lat"], 4), round(place["lng"], 4)) for place in places)
+
+    # Fetch traffic data (keyed on name/coordinates only, so reruns don't rehash full place dicts)
+    @st.cache_data(ttl=600, max_entries=128, show_spinner=False)
+    def get_traffic_data_cached(origin_lat, origin_lng, places_key, api_key=GOOGLE_MAPS_API_KEY):
+        # Default to 15 mins / level 5 and overwrite only successful lookups
+        travel_times = np.full(len(places_key), 15, dtype=np.int32)
+        ok = np.zeros(len(places_key), dtype=bool)
+        session = get_http_session()
+        for start in range(0, len(places_key), DISTANCE_MATRIX_BATCH_SIZE):
+            batch = places_key[start:start + DISTANCE_MATRIX_BATCH_SIZE]
+            params = {
+                "origins": f"{origin_lat},{origin_lng}",
+                "destinations": "|".join(f"{dest_lat},{dest_lng}" for _, dest_lat, dest_lng in batch),
+                "key": api_key,
+                "departure_time": "now",
+                "traffic_model": "best_guess",
+            }
             try:
-                dest_lat, dest_lng = place["lat"], place["lng"]
-                url = f"https://maps.googleapis.com/maps/api/distancematrix/json?origins={origin_lat},{origin_lng}&destinations={dest_lat},{dest_lng}&key={api_key}&departure_time=now&traffic_model=best_guess"
-                response = requests.get(url)
+                response = session.get(DISTANCE_MATRIX_URL, params=params, timeout=5)
                 data = response.json()
                 if data["status"] == "OK" and data["rows"]:
-                    element = data["rows"][0]["elements"][0]
-                    if element["status"] == "OK":
-                        travel_time = element["duration_in_traffic"]["value"] // 60
-                        traffic_level = min(max(travel_time // 5, 1), 10)
-                    else:
-                        travel_time = 15
-                        traffic_level = 5
-                        default_count += 1
-                    traffic_data[place["name"]] = {"travel_time": travel_time, "traffic_level": traffic_level}
-                else:
-                    traffic_data[place["name"]] = {"travel_time": 15, "traffic_level": 5}
-                    default_count += 1
+                    for offset, element in enumerate(data["rows"][0]["elements"]):
+                        if element["status"] == "OK" and "duration_in_traffic" in element:
+                            travel_times[start + offset] = element["duration_in_traffic"]["value"] // 60
+                            ok[start + offset] = True
             except Exception as e:
-                logger.error(f"Error fetching traffic for {place['name']}: {str(e)}")
-                traffic_data[place["name"]] = {"travel_time": 15, "traffic_level": 5}
-                default_count += 1
-        if default_count > len(places) // 2:
+                logger.error(f"Error fetching traffic for {', '.join(name for name, _, _ in batch)}: {str(e)}")
+        traffic_levels = np.where(ok, np.clip(travel_times // 5, 1, 10), 5).astype(np.int8)
+        traffic_data = {
+            name: {"travel_time": int(travel_time), "traffic_level": int(traffic_level)}
+            for (name, _, _), travel_time, traffic_level in zip(places_key, travel_times, traffic_levels)
+        }
+        default_count = len(places_key) - int(ok.sum())
+        if default_count > len(places_key) // 2:
             logger.warning("More than half of traffic data requests failed; using default travel times.")
         return traffic_data
 
-    # Categorize places based on types
-    place_type_categories = {
-        "park": "outdoor",
-        "museum": "indoor",
-        "art_gallery": "indoor",
-        "restaurant": "dining",
-        "cafe": "dining",
-        "bar": "dining",
-        "amusement_park": "outdoor",
-        "zoo": "outdoor",
-        "shopping_mall": "indoor",
-        "point_of_interest": "mixed",
-        "establishment": "mixed",
-    }
+    def get_traffic_data_for_places_cached(origin_lat, origin_lng, places):
+        return get_traffic_data_cached(origin_lat, origin_lng, places_cache_key(places))
 
     def categorize_place(types):
         for t in types:
-            if t in place_type_categories:
-                return place_type_categories[t]
+            if t in PLACE_TYPE_CATEGORIES:
+                return PLACE_TYPE_CATEGORIES[t]
         return "mixed"
 
-    # Generate itinerary
-    def generate_itinerary(recommendations, weather_data, user_preferences, num_days):
+    # Generate itinerary (sorted_recs must already be ordered by travel time)
+    def generate_itinerary(sorted_recs, weather_data, user_preferences, num_days):
         itinerary = []
-        sorted_recs = sorted(recommendations, key=lambda x: x["Travel Time"])
         outdoor_friendly = "clear" in weather_data["condition"] or "sunny" in weather_data["condition"] or "few clouds" in weather_data["condition"]
         
-        for day in range(num_days):
+        # Only loop over days that actually have places (4 per day)
+        max_days = min(num_days, (len(sorted_recs) + 3) // 4)
+        for day in range(max_days):
             start_idx = day * 4
             end_idx = start_idx + 4
             day_places = sorted_recs[start_idx:end_idx]
-            if not day_places:
-                break
             for place in day_places:
                 category = categorize_place(place.get("types", []))
                 travel_time = place["Travel Time"]
@@ -875,79 +977,155 @@ elif page == "✈️ PLAN YOUR TRIP":
                 })
         return itinerary
 
-    # Recommend places
-    def recommend_places(places, traffic_data, weather_quality, user_preferences, sort_by_travel_time=False):
+    # Build a hashable summary of the recommendation fields the itinerary uses
+    def itinerary_cache_key(recommendations):
+        return tuple(
+            (rec["Place"], rec["Travel Time"], rec["Rating"], rec["lat"], rec["lng"], tuple(rec["types"]))
+            for rec in recommendations
+        )
+
+    # Cache itineraries so day-count changes on the same recommendations are cache hits
+    @st.cache_data(show_spinner=False, max_entries=64)
+    def generate_itinerary_cached(rec_key, weather_condition, num_days):
+        sorted_recs = [
+            {"Place": place, "Travel Time": travel_time, "Rating": rating, "lat": lat, "lng": lng, "types": list(types)}
+            for place, travel_time, rating, lat, lng, types in rec_key
+        ]
+        return generate_itinerary(sorted_recs, {"condition": weather_condition}, None, num_days)
+
+    # Convert a list of place dicts into a struct-of-arrays layout for vectorized scoring
+    def places_to_soa(places):
+        return {
+            "name": np.array([place["name"] for place in places], dtype=object),
+            "lat": np.array([place["lat"] for place in places], dtype=np.float64),
+            "lng": np.array([place["lng"] for place in places], dtype=np.float64),
+            "rating": np.array([float(place["rating"]) if place["rating"] != "N/A" else 3.0 for place in places], dtype=np.float64),
+            "types": tuple(tuple(place["types"]) for place in places)
+        }
+
+    # Recommend places (places_soa comes from places_to_soa)
+    def recommend_places(places_soa, traffic_data, weather_quality, user_preferences):
         weather_importance = user_preferences.get("weather_importance", 0.3)
         crowd_importance = user_preferences.get("crowd_importance", 0.3)
         attractions_importance = user_preferences.get("attractions_importance", 0.2)
         trip_type = user_preferences.get("trip_type", "Adventure")
 
-        trip_type_weights = {"Adventure": 1.2, "Relaxation": 0.8, "Cultural": 1.5}
-        trip_factor = trip_type_weights.get(trip_type, 1.0)
+        # Resolve the trip-type weighting once per call rather than per place
+        trip_factor = TRIP_TYPE_WEIGHTS.get(trip_type, 1.0)
+        crowd_mult = trip_factor if trip_type == "Adventure" else 1.0
+        rating_mult = trip_factor if trip_type == "Cultural" else 1.0
 
-        scored_places = []
         max_travel_time = max([data["travel_time"] for data in traffic_data.values()] + [1])
+        travel_times = np.array(
+            [traffic_data.get(name, {}).get("travel_time", 15) for name in places_soa["name"]], dtype=np.float64
+        )
+        ratings = places_soa["rating"]
 
-        for place in places:
-            travel_time = traffic_data.get(place["name"], {}).get("travel_time", 15)
-            rating = float(place["rating"]) if place["rating"] != "N/A" else 3.0
-            norm_travel = travel_time / max_travel_time
-            norm_rating = rating / 5
-
-            score = (
-                (weather_importance * weather_quality / 10) +
-                (crowd_importance * (1 - norm_travel) * (trip_factor if trip_type == "Adventure" else 1.0)) +
-                (attractions_importance * norm_rating * (trip_factor if trip_type == "Cultural" else 1.0))
-            ) * 10
-            scored_places.append({
-                "Place": place["name"],
-                "Travel Time": travel_time,
-                "Rating": rating,
-                "Score": score,
-                "lat": place["lat"],
-                "lng": place["lng"],
-                "types": place["types"]
-            })
+        scores = score_places(
+            travel_times, ratings,
+            float(max_travel_time), float(weather_quality),
+            float(weather_importance), float(crowd_importance), float(attractions_importance),
+            crowd_mult, rating_mult
+        )
 
-        if sort_by_travel_time:
-            sorted_places = sorted(scored_places, key=lambda x: (x["Travel Time"], -x["Score"]))
-        else:
-            sorted_places = sorted(scored_places, key=lambda x: -x["Score"])
-        
-        return sorted_places
+        return [{
+            "Place": places_soa["name"][i],
+            "Travel Time": int(travel_times[i]),
+            "Rating": float(ratings[i]),
+            "Score": float(scores[i]),
+            "lat": float(places_soa["lat"][i]),
+            "lng": float(places_soa["lng"][i]),
+            "types": list(places_soa["types"][i])
+        } for i in range(len(places_soa["name"]))]
+
+    # Order scored places by score, best first (only the best top_k when given)
+    def sort_by_score(scored_places, top_k=None):
+        if top_k is not None:
+            return heapq.nlargest(top_k, scored_places, key=lambda x: x["Score"])
+        return sorted(scored_places, key=lambda x: -x["Score"])
+
+    # Order scored places by travel time, breaking ties by score (only the nearest top_k when given)
+    def sort_by_travel(scored_places, top_k=None):
+        if top_k is not None:
+            return heapq.nsmallest(top_k, scored_places, key=lambda x: (x["Travel Time"], -x["Score"]))
+        return sorted(scored_places, key=lambda x: (x["Travel Time"], -x["Score"]))
+
+    # Build the Explore Nearby table once per fetch so the tab only slices it
+    def build_nearby_table(nearby_places, traffic_data):
+        return pd.DataFrame({
+            "name": [place["name"] for place in nearby_places],
+            "rating": [place["rating"] for place in nearby_places],
+            "photo_url": [
+                f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=400&photoreference={place['photo']}&key={GOOGLE_MAPS_API_KEY}"
+                if place["photo"] else ""
+                for place in nearby_places
+            ],
+            "travel_time": [traffic_data.get(place["name"], {}).get("travel_time", 15) for place in nearby_places]
+        })
+
+    # Fetch and score the top places around a single pit stop
+    def process_pit_stop(stop, origin_lat, origin_lng, weather_quality, user_preferences):
+        stop_lat, stop_lng = get_coordinates(stop)
+        if not stop_lat or not stop_lng:
+            return None
+        stop_places = get_nearby_places_cached(stop_lat, stop_lng)
+        stop_traffic = get_traffic_data_for_places_cached(origin_lat, origin_lng, stop_places)
+        return sort_by_score(recommend_places(
+            places_to_soa(stop_places), stop_traffic, weather_quality, user_preferences
+        ), top_k=3)
 
-    # Generate PDF with dark theme
+    # Generate PDF with dark theme (fixed layout, so rows are drawn straight onto the canvas)
     def generate_itinerary_pdf(itinerary, destination, num_days, pit_stops=None):
         try:
             # Create a file-like buffer to receive PDF data
             buffer = io.BytesIO()
             
-            # Create the PDF object using ReportLab
-            doc = SimpleDocTemplate(buffer, pagesize=letter)
+            # Create the PDF canvas using ReportLab
+            c = canvas.Canvas(buffer, pagesize=letter)
+            page_width, page_height = letter
+            margin = inch
             
-            # Container for the 'Flowable' objects
-            elements = []
+            # Precompute table geometry
+            col_widths = [2.5*inch, 1.0*inch, 1.0*inch, 1.0*inch, 0.7*inch]
+            col_x = [margin + sum(col_widths[:i]) for i in range(len(col_widths))]
+            padding = 4
             
-            # Define styles
-            styles = getSampleStyleSheet()
-            title_style = styles['Heading1']
-            title_style.textColor = colors.black
-            subtitle_style = styles['Heading2']
-            subtitle_style.textColor = colors.black
-            normal_style = styles['Normal']
-            normal_style.textColor = colors.black
+            def draw_row(cells, top, height, fill_color, font_name, font_size):
+                # Cell backgrounds and grid
+                c.setFillColor(fill_color)
+                c.setStrokeColor(colors.darkgrey)
+                c.setLineWidth(1)
+                for x, width in zip(col_x, col_widths):
+                    c.rect(x, top - height, width, height, stroke=1, fill=1)
+                
+                # Cell text, vertically centred; wrapped lines are stacked
+                c.setFillColor(colors.black)
+                c.setFont(font_name, font_size)
+                leading = font_size * 1.2
+                for x, width, lines in zip(col_x, col_widths, cells):
+                    text_y = top - (height - len(lines) * leading) / 2 - font_size
+                    for line in lines:
+                        c.drawCentredString(x + width / 2, text_y, line)
+                        text_y -= leading
             
             # Add title
-            elements.append(Paragraph(f"Travel Itinerary for {destination}", title_style))
-            elements.append(Spacer(1, 0.25*inch))
-            elements.append(Paragraph(f"Duration: {num_days} days", subtitle_style))
-            elements.append(Spacer(1, 0.25*inch))
+            y = page_height - margin
+            c.setFillColor(colors.black)
+            c.setFont("Helvetica-Bold", 18)
+            c.drawString(margin, y, f"Travel Itinerary for {destination}")
+            y -= 0.5*inch
+            c.setFont("Helvetica-Bold", 14)
+            c.drawString(margin, y, f"Duration: {num_days} days")
+            y -= 0.4*inch
             
             # Add pit stops if available
             if pit_stops and any(pit_stops):
                 pit_stop_text = "Pit Stops: " + ", ".join([ps for ps in pit_stops if ps])
-                elements.append(Paragraph(pit_stop_text, normal_style))
-                elements.append(Spacer(1, 0.25*inch))
+                c.setFont("Helvetica", 10)
+                for line in simpleSplit(pit_stop_text, "Helvetica", 10, page_width - 2 * margin):
+                    c.drawString(margin, y, line)
+                    y -= 12
+                y -= 0.25*inch
             
             # Group by day
             days = {}
@@ -957,58 +1135,92 @@ elif page == "✈️ PLAN YOUR TRIP":
                     days[day] = []
                 days[day].append(item)
             
-            # Process each day
-            for day in sorted(days.keys()):
-                elements.append(Paragraph(day, subtitle_style))
-                elements.append(Spacer(1, 0.15*inch))
-                
-                # Create a table for this day's activities
-                day_items = days[day]
-                table_data = [["Place", "Category", "Best Time", "Travel Time", "Rating"]]
+            # Process each day, one page per day
+            header = [["Place"], ["Category"], ["Best Time"], ["Travel Time"], ["Rating"]]
+            for day_index, day in enumerate(sorted(days.keys())):
+                if day_index > 0:
+                    c.showPage()
+                    y = page_height - margin
                 
-                for item in day_items:
-                    place_paragraph = Paragraph(item['Place'], normal_style)
-                    table_data.append([
-                        place_paragraph,
-                        item['Category'],
-                        item['Best Time'],
-                        item['Travel Time'],
-                        str(item['Rating'])
-                    ])
+                c.setFillColor(colors.black)
+                c.setFont("Helvetica-Bold", 14)
+                c.drawString(margin, y, day)
+                y -= 0.3*inch
                 
-                # Create the table
-                table = Table(table_data, colWidths=[2.5*inch, 1.0*inch, 1.0*inch, 1.0*inch, 0.7*inch])
+                header_height = 12 * 1.2 + 2 * padding + 8
+                draw_row(header, y, header_height, colors.lightcoral, "Helvetica-Bold", 12)
+                y -= header_height
                 
-                # Add dark theme style to the table
-                table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.lightcoral),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 12),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.lightgreen),
-                    ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.darkgrey)
-                ]))
-                
-                elements.append(table)
-                elements.append(Spacer(1, 0.25*inch))
+                for item in days[day]:
+                    cells = [
+                        simpleSplit(item['Place'], "Helvetica", 10, col_widths[0] - 2 * padding),
+                        [item['Category']],
+                        [item['Best Time']],
+                        [item['Travel Time']],
+                        [str(item['Rating'])]
+                    ]
+                    row_height = len(cells[0]) * 10 * 1.2 + 2 * padding
+                    draw_row(cells, y, row_height, colors.lightgreen, "Helvetica", 10)
+                    y -= row_height
             
-            # Build the PDF
-            doc.build(elements)
+            # Finish the PDF
+            c.showPage()
+            c.save()
             
-            # Get the value of the BytesIO buffer
-            pdf_data = buffer.getvalue()
-            buffer.close()
+            # Hand back the rewound buffer itself instead of copying it out with getvalue()
+            buffer.seek(0)
             
             logger.info("PDF generation with ReportLab completed successfully")
-            return pdf_data
+            return buffer
             
         except Exception as e:
             logger.error(f"ReportLab PDF generation failed: {str(e)}")
             return None
 
+    # PDF bytes are cached per itinerary/destination/days/pit stops; ttl and max_entries bound the cache
+    @st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+    def get_itinerary_pdf_cached(itinerary, destination, num_days, pit_stops=None):
+        pdf_buffer = generate_itinerary_pdf(itinerary, destination, num_days, pit_stops)
+        return pdf_buffer.getvalue() if pdf_buffer else None
+
+    # Build the itinerary map once per (center, itinerary) and reuse its rendered HTML across reruns.
+    # The HTML is cached rather than the folium.Map, since every render of a Map appends its scripts again.
+    @st.cache_data(show_spinner=False, max_entries=32)
+    def build_itinerary_map_html(center, destination, points):
+        m = folium.Map(location=list(center), zoom_start=12)
+        
+        # Add destination marker
+        folium.Marker(
+            list(center),
+            popup=destination,
+            icon=icon_for("destination")
+        ).add_to(m)
+        
+        # Add itinerary places as a single GeoJSON layer, colored per day
+        features = []
+        for lat, lng, day, place, best_time in points:
+            day_num = int(day.split()[-1]) - 1
+            features.append({
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [lng, lat]},
+                "properties": {
+                    "day": day,
+                    "color": DAY_COLORS[day_num % len(DAY_COLORS)],
+                    "popup": f"{place} - {day} - {best_time}"
+                }
+            })
+        folium.GeoJson(
+            {"type": "FeatureCollection", "features": features},
+            marker=folium.CircleMarker(radius=8, fill=True, fill_opacity=0.9),
+            style_function=lambda feature: {
+                "color": feature["properties"]["color"],
+                "fillColor": feature["properties"]["color"]
+            },
+            popup=folium.GeoJsonPopup(fields=["popup"], labels=False)
+        ).add_to(m)
+        
+        return m.get_root().render()
+
     # Create a route with multiple stops
     def create_route_with_stops(origin, destination, stops):
         # Filter out empty stops
@@ -1151,6 +1363,8 @@ elif page == "✈️ PLAN YOUR TRIP":
             st.session_state.weather_data = None
             st.session_state.destination = "Bangalore"
             st.session_state.nearby_places = None
+            st.session_state.nearby_places_soa = None
+            st.session_state.nearby_df = None
             st.session_state.lat = None
             st.session_state.lng = None
             st.session_state.user_lat = None
@@ -1204,6 +1418,14 @@ elif page == "✈️ PLAN YOUR TRIP":
         st.markdown(f"<h3 style='color: #64b5f6;'>{t('pit_stops')}</h3>", unsafe_allow_html=True)
         st.markdown(f"<p>{t('pit_stops_desc')}</p>", unsafe_allow_html=True)
         
+        # Button callbacks update state before the rerun the click already triggers, so no extra st.rerun() is needed
+        def add_pit_stop():
+            st.session_state.pit_stop_count += 1
+
+        def reset_pit_stops():
+            st.session_state.pit_stops = ["", "", ""]
+            st.session_state.pit_stop_count = 0
+
         # Display existing pit stops and add button
         col1, col2 = st.columns([3, 1])
         with col1:
@@ -1213,18 +1435,15 @@ elif page == "✈️ PLAN YOUR TRIP":
             else:
                 st.markdown(f"<p><i>{t('no_stops')}</i></p>", unsafe_allow_html=True)
         with col2:
-            if st.session_state.pit_stop_count < 3 and st.button(t("add_stop"), key="add_stop_btn"):
-                st.session_state.pit_stop_count += 1
-                st.rerun()
+            if st.session_state.pit_stop_count < 3:
+                st.button(t("add_stop"), key="add_stop_btn", on_click=add_pit_stop)
         
         # Show input fields for pit stops
         for i in range(st.session_state.pit_stop_count):
             st.session_state.pit_stops[i] = st.text_input(f"Pit Stop {i+1}", st.session_state.pit_stops[i], key=f"stop_{i}")
         
-        if st.session_state.pit_stop_count > 0 and st.button(t("reset_stops"), key="reset_stops"):
-            st.session_state.pit_stops = ["", "", ""]
-            st.session_state.pit_stop_count = 0
-            st.rerun()
+        if st.session_state.pit_stop_count > 0:
+            st.button(t("reset_stops"), key="reset_stops", on_click=reset_pit_stops)
         st.markdown("</div>", unsafe_allow_html=True)
         
         # Plan trip button
@@ -1257,45 +1476,45 @@ elif page == "✈️ PLAN YOUR TRIP":
                 # Get nearby places
                 nearby_places = get_nearby_places_cached(lat, lng)
                 st.session_state.nearby_places = nearby_places
+                st.session_state.nearby_places_soa = places_to_soa(nearby_places)
                 
                 # Get traffic data
                 traffic_data = get_traffic_data_for_places_cached(
                     st.session_state.user_lat, st.session_state.user_lng, nearby_places
                 )
                 
-                # Get recommendations
-                recommendations = recommend_places(
-                    nearby_places, traffic_data, weather_data["quality"], user_preferences
-                )
-                recommendations_by_time = recommend_places(
-                    nearby_places, traffic_data, weather_data["quality"], user_preferences, sort_by_travel_time=True
+                # Explore Nearby measures travel from the destination when the user location couldn't be resolved
+                if st.session_state.user_lat and st.session_state.user_lng:
+                    nearby_traffic = traffic_data
+                else:
+                    nearby_traffic = get_traffic_data_for_places_cached(lat, lng, nearby_places)
+                st.session_state.nearby_df = build_nearby_table(nearby_places, nearby_traffic)
+                
+                # Get recommendations (score once, then sort both ways)
+                scored_places = recommend_places(
+                    st.session_state.nearby_places_soa, traffic_data, weather_data["quality"], user_preferences
                 )
                 
-                st.session_state.recommendations = recommendations
-                st.session_state.recommendations_by_time = recommendations_by_time
+                st.session_state.recommendations = sort_by_score(scored_places)
+                st.session_state.recommendations_by_time = sort_by_travel(scored_places)
                 
                 # Process pit stops if provided
                 if any(st.session_state.pit_stops):
                     st.session_state.pit_stop_data = {}
-                    for stop in st.session_state.pit_stops:
-                        if stop:
-                            # Get coordinates for pit stop
-                            stop_lat, stop_lng = get_coordinates(stop)
-                            if stop_lat and stop_lng:
-                                # Get nearby places for pit stop
-                                stop_places = get_nearby_places_cached(stop_lat, stop_lng)
-                                
-                                # Get traffic data for pit stop
-                                stop_traffic = get_traffic_data_for_places_cached(
-                                    st.session_state.user_lat, st.session_state.user_lng, stop_places
-                                )
-                                
-                                # Get recommendations for pit stop
-                                stop_recommendations = recommend_places(
-                                    stop_places, stop_traffic, weather_data["quality"], user_preferences
-                                )[:3]
-                                
-                                st.session_state.pit_stop_data[stop] = stop_recommendations
+                    stops = [stop for stop in st.session_state.pit_stops if stop]
+                    origin_lat, origin_lng = st.session_state.user_lat, st.session_state.user_lng
+                    
+                    # Process stops concurrently; worker threads share this run's context so cached calls work
+                    ctx = get_script_run_ctx()
+                    with ThreadPoolExecutor(max_workers=3, initializer=add_script_run_ctx, initargs=(None, ctx)) as executor:
+                        results = list(executor.map(
+                            lambda stop: process_pit_stop(stop, origin_lat, origin_lng, weather_data["quality"], user_preferences),
+                            stops
+                        ))
+                    
+                    for stop, stop_recommendations in zip(stops, results):
+                        if stop_recommendations is not None:
+                            st.session_state.pit_stop_data[stop] = stop_recommendations
 
         # Tabs for different views
         if st.session_state.recommendations:
@@ -1313,50 +1532,64 @@ elif page == "✈️ PLAN YOUR TRIP":
                 )
                 
                 st.markdown(f"{t('recommendations_travel_time')}")
-                for i, place in enumerate(st.session_state.recommendations_by_time[:st.session_state.num_places_to_show]):
-                    with st.container():
-                        st.markdown(f"""
-                        <div class="recommendation-card">
-                            <div class="place-name">{i+1}. {place['Place']}</div>
-                            <div class="place-info">
-                                <span class="place-rating">⭐ {place['Rating']}</span>
-                                <span class="place-time">🕒 {place['Travel Time']} mins</span>
-                            </div>
-                        </div>
-                        """, unsafe_allow_html=True)
+                # Render all cards in a single markdown element
+                cards_html = "".join(f"""
+                <div class="recommendation-card">
+                    <div class="place-name">{i+1}. {place['Place']}</div>
+                    <div class="place-info">
+                        <span class="place-rating">⭐ {place['Rating']}</span>
+                        <span class="place-time">🕒 {place['Travel Time']} mins</span>
+                    </div>
+                </div>
+                """ for i, place in enumerate(st.session_state.recommendations_by_time[:st.session_state.num_places_to_show]))
+                st.markdown(cards_html, unsafe_allow_html=True)
                 
             
                 
                 # Map for top recommendations
                 if st.session_state.lat and st.session_state.lng:
                     st.subheader("🗺️ Map View")
-                    m = folium.Map(location=[st.session_state.lat, st.session_state.lng], zoom_start=12)
-                    
-                    # Add destination marker
-                    folium.Marker(
-                        [st.session_state.lat, st.session_state.lng],
-                        popup=st.session_state.destination,
-                        icon=folium.Icon(color="red", icon="info-sign")
-                    ).add_to(m)
+                    show_user = bool(st.session_state.user_lat and st.session_state.user_lng and user_location)
+                    map_places = st.session_state.recommendations[:st.session_state.num_places_to_show]
+                    map_key = (
+                        st.session_state.lat, st.session_state.lng, st.session_state.destination,
+                        (st.session_state.user_lat, st.session_state.user_lng) if show_user else None,
+                        tuple((place["Place"], place["Rating"], place["Travel Time"]) for place in map_places)
+                    )
                     
-                    # Add user location marker if provided
-                    if st.session_state.user_lat and st.session_state.user_lng and user_location:
+                    # Rebuild the map HTML only when its contents change
+                    if st.session_state.get("_map_key") != map_key:
+                        m = folium.Map(location=[st.session_state.lat, st.session_state.lng], zoom_start=12)
+                        
+                        # Add destination marker
                         folium.Marker(
-                            [st.session_state.user_lat, st.session_state.user_lng],
-                            popup="Your Location",
-                            icon=folium.Icon(color="green", icon="home")
+                            [st.session_state.lat, st.session_state.lng],
+                            popup=st.session_state.destination,
+                            icon=icon_for("destination")
                         ).add_to(m)
-                    
-                    # Add recommended places markers
-                    for i, place in enumerate(st.session_state.recommendations[:st.session_state.num_places_to_show]):
-                        folium.Marker(
-                            [place["lat"], place["lng"]],
-                            popup=f"{place['Place']} - ⭐ {place['Rating']} - 🕒 {place['Travel Time']} mins",
-                            icon=folium.Icon(color="blue", icon="map-marker")
+                        
+                        # Add user location marker if provided
+                        if show_user:
+                            folium.Marker(
+                                [st.session_state.user_lat, st.session_state.user_lng],
+                                popup="Your Location",
+                                icon=icon_for("user")
+                            ).add_to(m)
+                        
+                        # Add recommended places as one client-side marker layer
+                        FastMarkerCluster(
+                            [
+                                [place["lat"], place["lng"], f"{place['Place']} - ⭐ {place['Rating']} - 🕒 {place['Travel Time']} mins"]
+                                for place in map_places
+                            ],
+                            callback=PLACE_MARKER_CALLBACK
                         ).add_to(m)
+                        
+                        st.session_state._map_html = m.get_root().render()
+                        st.session_state._map_key = map_key
                     
                     # Display the map
-                    st_folium(m, width=700, height=500)
+                    st.iframe(st.session_state._map_html, width=700, height=500)
                     
                     # Get directions button
                     if user_location:
@@ -1376,17 +1609,16 @@ elif page == "✈️ PLAN YOUR TRIP":
                 else:
                     for stop, recommendations in st.session_state.pit_stop_data.items():
                         with st.expander(f"🛑 {stop}"):
-                            for i, place in enumerate(recommendations):
-                                with st.container():
-                                    st.markdown(f"""
-                                    <div class="recommendation-card">
-                                        <div class="place-name">{i+1}. {place['Place']}</div>
-                                        <div class="place-info">
-                                            <span class="place-rating">⭐ {place['Rating']}</span>
-                                            <span class="place-time">🕒 {place['Travel Time']} mins</span>
-                                        </div>
-                                    </div>
-                                    """, unsafe_allow_html=True)
+                            cards_html = "".join(f"""
+                            <div class="recommendation-card">
+                                <div class="place-name">{i+1}. {place['Place']}</div>
+                                <div class="place-info">
+                                    <span class="place-rating">⭐ {place['Rating']}</span>
+                                    <span class="place-time">🕒 {place['Travel Time']} mins</span>
+                                </div>
+                            </div>
+                            """ for i, place in enumerate(recommendations))
+                            st.markdown(cards_html, unsafe_allow_html=True)
                             
                             if user_location:
                                 if st.button(f"{t('get_directions_to')} {stop}", key=f"dir_{stop}"):
@@ -1401,10 +1633,9 @@ elif page == "✈️ PLAN YOUR TRIP":
 
                 
                 # Generate itinerary
-                itinerary = generate_itinerary(
-                    st.session_state.recommendations[:20], 
-                    st.session_state.weather_data,
-                    user_preferences,
+                itinerary = generate_itinerary_cached(
+                    itinerary_cache_key(st.session_state.recommendations_by_time[:20]),
+                    st.session_state.weather_data["condition"],
                     num_days
                 )
                 
@@ -1421,32 +1652,31 @@ elif page == "✈️ PLAN YOUR TRIP":
                     
                     for day, items in days.items():
                         with st.expander(day, expanded=False):
-                            for item in items:
-                                with st.container():
-                                    st.markdown(f"""
-                                    <div class="recommendation-card">
-                                        <div class="place-name">{item['Place']}</div>
-                                        <div class="place-info">
-                                            <span class="place-category">🏛️ {item['Category']}</span>
-                                            <span class="place-time">⏰ {item['Best Time']}</span>
-                                            <span class="place-traffic">{item['Traffic']} {item['Travel Time']}</span>
-                                            <span class="place-rating">⭐ {item['Rating']}</span>
-                                        </div>
-                                    </div>
-                                    """, unsafe_allow_html=True)
+                            cards_html = "".join(f"""
+                            <div class="recommendation-card">
+                                <div class="place-name">{item['Place']}</div>
+                                <div class="place-info">
+                                    <span class="place-category">🏛️ {item['Category']}</span>
+                                    <span class="place-time">⏰ {item['Best Time']}</span>
+                                    <span class="place-traffic">{item['Traffic']} {item['Travel Time']}</span>
+                                    <span class="place-rating">⭐ {item['Rating']}</span>
+                                </div>
+                            </div>
+                            """ for item in items)
+                            st.markdown(cards_html, unsafe_allow_html=True)
                     
                     # Download itinerary PDF button
                     if st.button(t("download_itinerary"), key="download_itinerary"):
-                        pdf_data = generate_itinerary_pdf(
+                        pdf_buffer = get_itinerary_pdf_cached(
                             itinerary, 
                             st.session_state.destination, 
                             num_days,
                             st.session_state.pit_stops
                         )
-                        if pdf_data:
+                        if pdf_buffer:
                             st.download_button(
                                 label="📥 Download PDF",
-                                data=pdf_data,
+                                data=pdf_buffer,
                                 file_name=f"itinerary_{st.session_state.destination}.pdf",
                                 mime="application/pdf",
                             )
@@ -1455,93 +1685,68 @@ elif page == "✈️ PLAN YOUR TRIP":
                     # Map for itinerary
                     if st.session_state.lat and st.session_state.lng:
                         st.subheader("🗺️ Itinerary Map")
-                        m = folium.Map(location=[st.session_state.lat, st.session_state.lng], zoom_start=12)
-                        
-                        # Add destination marker
-                        folium.Marker(
-                            [st.session_state.lat, st.session_state.lng],
-                            popup=st.session_state.destination,
-                            icon=folium.Icon(color="red", icon="info-sign")
-                        ).add_to(m)
-                        
-                        # Color by day
-                        day_colors = ["blue", "green", "purple", "orange", "darkpurple"]
-                        
-                        # Add itinerary places markers
-                        for item in itinerary:
-                            day_num = int(item['Day'].split()[-1]) - 1
-                            color = day_colors[day_num % len(day_colors)]
-                            folium.Marker(
-                                [item["lat"], item["lng"]],
-                                popup=f"{item['Place']} - {item['Day']} - {item['Best Time']}",
-                                icon=folium.Icon(color=color)
-                            ).add_to(m)
+                        map_html = build_itinerary_map_html(
+                            (st.session_state.lat, st.session_state.lng),
+                            st.session_state.destination,
+                            tuple((item["lat"], item["lng"], item["Day"], item["Place"], item["Best Time"]) for item in itinerary)
+                        )
                         
                         # Display the map
-                        st_folium(m, width=700, height=500)
+                        st.iframe(map_html, width=700, height=500)
                     
                 
             
             with tab4:
                 st.subheader(f"Explore Nearby in {st.session_state.destination}")
-                if st.session_state.nearby_places:
-                    origin_lat, origin_lng = (st.session_state.user_lat, st.session_state.user_lng) if st.session_state.user_lat and st.session_state.user_lng else (st.session_state.lat, st.session_state.lng)
-                    traffic_data = get_traffic_data_for_places_cached(origin_lat, origin_lng, st.session_state.nearby_places)
-                    places_to_show = st.session_state.nearby_places[:st.session_state.num_places_to_show]
+                if st.session_state.nearby_places and st.session_state.nearby_df is not None:
+                    places_to_show = st.session_state.nearby_df.head(st.session_state.num_places_to_show)
                     cols = st.columns(3)
-                    for i, place in enumerate(places_to_show):
+                    for i, place in enumerate(places_to_show.itertuples(index=False)):
                         with cols[i % 3]:
-                            st.markdown(f"*{place['name']}*")
-                            if place["photo"]:
-                                photo_url = f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=400&photoreference={place['photo']}&key={GOOGLE_MAPS_API_KEY}"
+                            st.markdown(f"*{place.name}*")
+                            if place.photo_url:
                                 st.markdown(
-                                    f'<img src="{photo_url}" style="max-width:100%; height:auto; border-radius:8px; margin:5px 0;">',
+                                    f'<img src="{place.photo_url}" style="max-width:100%; height:auto; border-radius:8px; margin:5px 0;">',
                                     unsafe_allow_html=True
                                 )
                             else:
                                 st.write("No photo available")
-                            st.write(f"Rating: {place['rating']} ★" if place['rating'] != 'N/A' else "Rating: N/A")
-                            travel_time = traffic_data.get(place['name'], {}).get('travel_time', 15)
-                            st.write(f"Travel Time: {travel_time} mins")
+                            st.write(f"Rating: {place.rating} ★" if place.rating != 'N/A' else "Rating: N/A")
+                            st.write(f"Travel Time: {place.travel_time} mins")
                             origin = user_location if user_location else st.session_state.destination
-                            directions_url = f"https://www.google.com/maps/dir/?api=1&origin={origin}&destination={place['name']}"
+                            directions_url = f"https://www.google.com/maps/dir/?api=1&origin={origin}&destination={place.name}"
                             st.markdown(
                                 f'<a href="{directions_url}" target="_blank" style="text-decoration:none;"><button style="background-color:#3498db; color:white; padding:5px 10px; border:none; border-radius:5px;">Get Directions</button></a>',
                                 unsafe_allow_html=True
                             )
                             st.markdown("<hr style='margin:15px 0; border:0; border-top:1px solid #ddd;'>", unsafe_allow_html=True)
                     st.markdown("<div style='text-align: center;'>", unsafe_allow_html=True)
-                    if st.button("Show More", key="show_more") and st.session_state.num_places_to_show < len(st.session_state.nearby_places):
-                        st.session_state.num_places_to_show += 6
-                        st.rerun()
+                    def show_more_places():
+                        if st.session_state.num_places_to_show < len(st.session_state.nearby_places):
+                            st.session_state.num_places_to_show += 6
+
+                    st.button("Show More", key="show_more", on_click=show_more_places)
                     st.markdown("</div>", unsafe_allow_html=True)
                 else:
                     st.info("Nearby places will load after recommendations are fetched.")
             
         # Footer
         st.markdown("---")
-        col1, col2, col3 = st.columns([1, 2, 1])
-        with col2:
-            st.markdown(
-                f"<p style='text-align: center; color: #a0a0a0;'>{t('footer_text')}</p>", 
-                unsafe_allow_html=True
-            )
-            st.markdown(
-                "<p style='text-align: center; color: #a0a0a0;'>© 2024 WanderWise Travel</p>", 
-                unsafe_allow_html=True
-            )
-            # Simulated user count - could be replaced with real analytics
- # Simulated number
-            st.markdown(
-                f"<p style='text-align: center; color: #64b5f6;'>{t('app_title')}</p>", 
-                unsafe_allow_html=True
-            )
+        st.markdown(f"""
+        <div style='max-width: 50%; margin: 0 auto; text-align: center;'>
+            <p style='color: #a0a0a0;'>{t('footer_text')}</p>
+            <p style='color: #a0a0a0;'>© 2024 WanderWise Travel</p>
+            <p style='color: #64b5f6;'>{t('app_title')}</p>
+        </div>
+        """, unsafe_allow_html=True)
 
     if __name__ == "__main__":
         main()
     
 # ------------- TRIP IDEAS PAGE -------------------
 elif page == "💡 TRIP IDEAS":
+    # Read the clock once per rerun for the seasonal section
+    now = datetime.now()
     
     st.markdown(f"<h1 class='main-header'>🗺️ {t('explore_nearby_places')}</h1>", unsafe_allow_html=True)
     
@@ -1571,57 +1776,24 @@ elif page == "💡 TRIP IDEAS":
     # Nearby cities section
     st.markdown(f"<h2 class='sub-header'>🚗 {t('day_trips_from_here')}</h2>", unsafe_allow_html=True)
     
-    nearby_cols = st.columns(len(city_info["nearby_cities"]))
-    
-    for i, nearby_city in enumerate(city_info["nearby_cities"]):
-        if nearby_city in city_data:
-            with nearby_cols[i]:
-                nearby_info = city_data[nearby_city]
-                image_base64 = get_image_base64(f"images/{nearby_city.lower().replace(' ', '_')}.jpg")
-                st.markdown(f"""
-                <div style="background-color: #1E1E1E; padding: 1.2rem; border-radius: 8px;
-                margin-bottom: 1.5rem; box-shadow: 0 4px 8px rgba(0,0,0,0.3);
-                border-left: 4px solid #9575CD;">
-                <img src="data:image/jpeg;base64,{image_base64}" width="100%" style="border-radius: 8px; margin-bottom: 10px;">
-                <h3 style="color: #FFFFFF; margin-top: 0;">{nearby_city}</h3>
-                <p style="font-size: 0.9rem; color: #E0E0E0;">{nearby_info['significance'][:80]}...</p>
-                <p style="font-size: 0.8rem; color: #E0E0E0;"><strong>{t('top_attraction')}:</strong> {nearby_info['attractions'][0]['name']}</p>
-                </div>
-                """, unsafe_allow_html=True)
+    top_attraction_label = t('top_attraction')
+    st.markdown(card_grid(NEARBY_CITY_CARD.substitute(
+                    image=CITY_IMAGE_B64.get(nearby_city),
+                    city=nearby_city,
+                    significance=city_data[nearby_city]['significance'][:80],
+                    attraction_label=top_attraction_label,
+                    attraction=city_data[nearby_city]['attractions'][0]['name']
+                ) for nearby_city in city_info["nearby_cities"] if nearby_city in city_data), unsafe_allow_html=True)
     # Featured itineraries
 
     st.markdown(f"<h2 class='sub-header'>{t('💡 Trip Ideas & Itineraries')}</h2>", unsafe_allow_html=True)
     
-    itineraries = [
-        {
-            "title": t("South India Cultural Tour"),
-            "duration": "7 days",
-            "cities": ["Chennai", "Mysuru", "Bengaluru"],
-            "description": "Experience the rich cultural heritage of South India through its temples, palaces, and vibrant traditions.",
-            "highlight": "Mysore Palace light show"
-        },
-        {
-            "title": "Coastal Getaway",
-            "duration": "5 days",
-            "cities": ["Chennai", "Pondicherry"],
-            "description": "Relax on beautiful beaches and explore charming coastal towns with French colonial influence.",
-            "highlight": "Sunrise at Promenade Beach in Pondicherry"
-        },
-        {
-            "title": "Weekend City Break",
-            "duration": "3 days",
-            "cities": ["Bengaluru"],
-            "description": "Explore the Garden City with its parks, microbreweries, and vibrant tech culture.",
-            "highlight": "Bangalore Palace tour"
-        }
-    ]
-    
-    for itin in itineraries:
+    for itin in ITINERARIES:
         st.markdown(f"""
         <div style="background-color: #1E1E1E; padding: 1.5rem; border-radius: 10px;
                margin-bottom: 1rem;border-left: 4px solid rgb(34, 186, 138);">
         <h3>{t(itin['title'])}</h3>
-        <p style="font-size: 0.9rem;"><strong>{t('Duration:')}</strong> {t(itin['duration'])} | <strong>{t('Cities:')}</strong> {', '.join([t(city) for city in itin['cities']])}</p>
+        <p style="font-size: 0.9rem;"><strong>{t('Duration:')}</strong> {t(itin['duration'])} | <strong>{t('Cities:')}</strong> {join_labels(tuple(itin['cities']), lang_code)}</p>
         <p>{t(itin['description'])}</p>
         <p><strong>{t('Highlight:')}</strong> {t(itin['highlight'])}</p>
         <a href="https://drive.google.com/file/d/1gVm__uD85a1lvYdhcUToovOKrUdC-PZ-/view?usp=sharing" 
@@ -1637,7 +1809,7 @@ elif page == "💡 TRIP IDEAS":
     # Seasonal recommendations
     st.markdown(f"<h2 style='color: #FFFFFF; margin-bottom: 1rem;'>{t('🌍 Seasonal Recommendations')}</h2>", unsafe_allow_html=True)
 
-    current_month = datetime.now().strftime("%B")
+    current_month = now.strftime("%B")
 
     st.markdown(f"""
     <div style="background-color: #1E1E1E; padding: 1.5rem; border-radius: 10px;
@@ -1649,7 +1821,7 @@ elif page == "💡 TRIP IDEAS":
     """, unsafe_allow_html=True)
 
     # Generate seasonal recommendations based on current month
-    current_month_num = datetime.now().month
+    current_month_num = now.month
     if 11 <= current_month_num <= 2:  # Winter
         recommendations = ["Mysuru", "Chennai", "Pondicherry"]
         reason = "pleasant temperatures and clear skies"
@@ -1660,44 +1832,19 @@ elif page == "💡 TRIP IDEAS":
         recommendations = ["Chennai", "Pondicherry", "Bengaluru"]
         reason = "post-monsoon greenery and cultural festivities"
     
-    rec_cols = st.columns(len(recommendations))
-    for i, city in enumerate(recommendations):
-        with rec_cols[i]:
-            if city in city_data:
-                city_info = city_data[city]
-                image_path = os.path.join("images", f"{city}.jpg")  # Construct the correct path
-                image_base64 = get_image_base64(image_path)  # Convert to base64
-
-                st.markdown(f"""
-                <div style="background-color: #1E1E1E; padding: 1.2rem; border-radius: 8px;
-                margin-bottom: 1.5rem; box-shadow: 0 4px 8px rgba(0,0,0,0.3);
-                border-left: 4px solid #9575CD;">
-                <img src="data:image/jpeg;base64,{image_base64}" width="100%" style="border-radius: 8px;">
-                <h3 style="color: #FFFFFF;">{t(city)}</h3>
-                <p style="color: #E0E0E0;">{t('Perfect this season for')} {t(reason)}.</p>
-                <p style="font-size: 0.8rem; color: #E0E0E0;">{t(city_info['info'])}</p>
-                </div>
-                """, unsafe_allow_html=True)
+    season_label, season_reason = t('Perfect this season for'), t(reason)
+    st.markdown(card_grid(SEASONAL_CITY_CARD.substitute(
+                    image=CITY_IMAGE_B64.get(city),
+                    city=t(city),
+                    season_label=season_label,
+                    reason=season_reason,
+                    info=t(city_data[city]['info'])
+                ) for city in recommendations if city in city_data), unsafe_allow_html=True)
 
     # Travel guides and resources
     st.markdown(f"<h2 class='sub-header'>{t('Travel Guides & Resources')}</h2>", unsafe_allow_html=True)
 
-    guide_cols = st.columns(2)
-
-    guides = [
-    {"title": "First-Time Visitor's Guide to South India", "type": "PDF Guide", 
-     "link": "https://drive.google.com/file/d/1p03M0hbZOL7W5AlmF4IfVdGQOr26iUxb/view?usp=sharing"},
-    {"title": "South Indian Cuisine: What to Try Where", "type": "Food Guide", 
-     "link": "https://drive.google.com/file/d/1Zp3Lam2U0rjxZfw2pwqi5Oqd9o-knLro/view?usp=sharing"},
-    {"title": "Navigating Public Transportation", "type": "Travel Tips", 
-     "link": "https://drive.google.com/file/d/1HqpqoR7LISyQ2VMFuq09nzbK8ho9Ej0Q/view?usp=sharing"},
-    {"title": "Cultural Etiquette in South India", "type": "Cultural Guide", 
-     "link": "https://drive.google.com/file/d/1aabpGkCMOAVXx3mfDiqkTXJkYQO4ZO8a/view?usp=sharing"}
-    ]
-
-    for i, guide in enumerate(guides):
-        with guide_cols[i % 2]:
-            st.markdown(f"""
+    st.markdown(card_grid((f"""
             <div style="display: flex; background-color:#1E1E1E; padding: 1rem;
                    border-radius: 8px; margin-bottom: 1rem; align-items: center;
                    box-shadow: 0 2px 4px rgba(0,0,0,0.1);border-left: 4px solid #1976D2;">
@@ -1711,8 +1858,8 @@ elif page == "💡 TRIP IDEAS":
                     <p style="margin: 0.3rem 0 0 0; color: #666;">{t(guide['type'])}</p>
                 </div>
             </a>
-            </div>  
-            """, unsafe_allow_html=True)
+            </div>
+            """ for guide in GUIDES), min_width="320px"), unsafe_allow_html=True)
 
 # ------------- AI ASSISTANCE PAGE -------------------
 elif page=="🤖 AI ASSISTANCE":
@@ -1722,8 +1869,12 @@ elif page=="🤖 AI ASSISTANCE":
     import os
     from datetime import datetime
     import re
+    import sqlite3
+    import threading
+    import time
+    import uuid
+    from collections import OrderedDict, deque
     from dotenv import load_dotenv
-    from openai import AzureOpenAI
 
     # Load environment variables from .env file
     load_dotenv()
@@ -1738,6 +1889,10 @@ elif page=="🤖 AI ASSISTANCE":
     APP_LAYOUT = "wide"
     DEFAULT_GREETING = "नमस्ते (Namaste)! 🙏 I'm your Global Yatra guide, ready to help you discover the incredible diversity and beauty of the World. What would you like to know about traveling today?"
     AZURE_MODEL = "gpt-35-turbo"  # Replace with your Azure deployment name if different
+    MAX_CHAT_TURNS = 20  # User/assistant exchanges kept in the chat history; older ones are dropped
+    RECENT_CHAT_MESSAGES = 2  # Latest exchange shown outside the "Earlier conversation" expander
+    CHAT_WINDOW_TURNS = 8  # Turns sent verbatim to the model; older ones are folded into a summary
+    DUPLICATE_PROMPT_WINDOW = 2.0  # Seconds within which an identical repeated prompt is ignored
     ICON_URL = "https://cdn-icons-png.flaticon.com/512/4249/4249408.png"
     SYSTEM_PROMPT = """You are Global Yatra, a specialized travel companion for travellers. 
     Your expertise includes:
@@ -1750,6 +1905,133 @@ elif page=="🤖 AI ASSISTANCE":
 
     Always be polite, helpful, and provide culturally respectful information. Include occasional 
     Hindi phrases where appropriate to enhance the cultural experience."""
+    # Static sidebar copy (translated at render time)
+    ABOUT_TEXT = "NILA is your personal AI travel companion for exploring across the World. Ask about destinations, accommodations, cuisine, cultural norms, and more!"
+    TRAVEL_TIPS = (
+        "Carry a reusable water bottle and water purification tablets.",
+        "Learn a few basic Hindi phrases to connect with locals.",
+        "Respect local customs by dressing modestly at religious sites.",
+        "Try regional cuisines - India has incredible food diversity!",
+        "Consider travel during the cooler months (October-March) for most regions."
+    )
+    # Prompt templates for condensing older chat turns, pre-bound to format_map
+    SUMMARY_REQUEST_TMPL = "Summarize the following conversation in at most 200 tokens, keeping any destinations, dates, budgets and preferences the traveller mentioned:\n\n{transcript}".format_map
+    SUMMARY_CONTEXT_TMPL = "Summary of the earlier conversation: {summary}".format_map
+
+    class PromptCache:
+        """Reuse answers to repeated opening questions, matched exactly after normalizing case, spacing and punctuation"""
+        
+        def __init__(self, max_entries=256):
+            self.max_entries = max_entries
+            self.responses = OrderedDict()
+            self.lock = threading.Lock()
+        
+        @staticmethod
+        def _normalize(prompt):
+            # Only formatting differences are ignored; any change in wording is a different question
+            return " ".join(re.sub(r"[^\w\s]", " ", prompt.casefold()).split())
+        
+        def get(self, prompt):
+            key = self._normalize(prompt)
+            with self.lock:
+                response = self.responses.get(key)
+                if response is not None:
+                    self.responses.move_to_end(key)
+                return response
+        
+        def add(self, prompt, response):
+            key = self._normalize(prompt)
+            with self.lock:
+                self.responses[key] = response
+                self.responses.move_to_end(key)
+                if len(self.responses) > self.max_entries:
+                    self.responses.popitem(last=False)
+
+    CHAT_DB_PATH = Path(__file__).parent / "chats.db"
+    CHAT_RETENTION_DAYS = 30  # Saved messages older than this are pruned from the chat database
+
+    class ChatHistoryStore:
+        """SQLite-backed chat history and rolling summaries, so conversations survive reloads and server restarts"""
+        
+        def __init__(self, path=CHAT_DB_PATH):
+            self.conn = sqlite3.connect(path, check_same_thread=False)
+            self.lock = threading.Lock()
+            with self.lock, self.conn:
+                self.conn.execute(
+                    "CREATE TABLE IF NOT EXISTS messages (session_id TEXT NOT NULL, role TEXT NOT NULL, content TEXT NOT NULL, created_at REAL NOT NULL)"
+                )
+                self.conn.execute("CREATE INDEX IF NOT EXISTS idx_messages_session ON messages (session_id)")
+                self.conn.execute("CREATE INDEX IF NOT EXISTS idx_messages_created ON messages (created_at)")
+                self.conn.execute(
+                    "CREATE TABLE IF NOT EXISTS summaries (session_id TEXT PRIMARY KEY, summary TEXT NOT NULL, updated_at REAL NOT NULL)"
+                )
+            self.prune()
+        
+        def load(self, session_id, limit):
+            """Return the latest `limit` messages of a session, oldest first"""
+            with self.lock:
+                rows = self.conn.execute(
+                    "SELECT role, content FROM messages WHERE session_id = ? ORDER BY rowid DESC LIMIT ?",
+                    (session_id, limit)
+                ).fetchall()
+            return [{"role": role, "content": content} for role, content in reversed(rows)]
+        
+        def load_summary(self, session_id):
+            """Return the saved summary of a session's trimmed context, or an empty string"""
+            with self.lock:
+                row = self.conn.execute(
+                    "SELECT summary FROM summaries WHERE session_id = ?", (session_id,)
+                ).fetchone()
+            return row[0] if row else ""
+        
+        def save_summary(self, session_id, summary):
+            with self.lock, self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO summaries (session_id, summary, updated_at) VALUES (?, ?, ?)",
+                    (session_id, summary, time.time())
+                )
+        
+        def append(self, session_id, role, content, keep=2 * MAX_CHAT_TURNS):
+            """Save a message, keeping only the latest `keep` messages of the session and pruning expired ones"""
+            with self.lock, self.conn:
+                self.conn.execute(
+                    "INSERT INTO messages (session_id, role, content, created_at) VALUES (?, ?, ?, ?)",
+                    (session_id, role, content, time.time())
+                )
+                self.conn.execute(
+                    "DELETE FROM messages WHERE session_id = ? AND rowid NOT IN "
+                    "(SELECT rowid FROM messages WHERE session_id = ? ORDER BY rowid DESC LIMIT ?)",
+                    (session_id, session_id, keep)
+                )
+            self.prune()
+        
+        def prune(self, max_age_days=CHAT_RETENTION_DAYS):
+            """Delete messages and summaries older than `max_age_days` across all sessions"""
+            cutoff = time.time() - max_age_days * 86400
+            with self.lock, self.conn:
+                self.conn.execute("DELETE FROM messages WHERE created_at < ?", (cutoff,))
+                self.conn.execute("DELETE FROM summaries WHERE updated_at < ?", (cutoff,))
+
+    @st.cache_resource(show_spinner=False)
+    def get_chat_store():
+        """Open the chat history database once per process"""
+        return ChatHistoryStore()
+
+    @st.cache_resource(show_spinner=False)
+    def get_prompt_cache():
+        """Share one prompt cache across all sessions"""
+        return PromptCache()
+
+    @st.cache_resource(show_spinner=False)
+    def get_azure_client(api_key, azure_endpoint):
+        """Create the Azure OpenAI client once per key/endpoint and reuse it across reruns"""
+        # Imported on first use so the page renders before the OpenAI SDK is loaded
+        from openai import AzureOpenAI
+        return AzureOpenAI(
+            api_key=api_key,
+            api_version="2023-05-15",
+            azure_endpoint=azure_endpoint
+        )
 
     class IndiaYatraChatbot:
         def __init__(self):
@@ -1761,51 +2043,153 @@ elif page=="🤖 AI ASSISTANCE":
             if "azure_endpoint" not in st.session_state:
                 st.session_state.azure_endpoint = os.getenv("AZURE_ENDPOINT", "")
 
-            # Initialize chat session state
+            # Chat session ID lives in the URL so a reload (or a bookmarked link) reopens the same conversation
+            if "chat_session_id" not in st.session_state:
+                session_id = st.query_params.get("chat")
+                if not session_id:
+                    session_id = uuid.uuid4().hex
+                    st.query_params["chat"] = session_id
+                st.session_state.chat_session_id = session_id
+            
+            # Initialize chat session state, restoring any saved history
             if "messages" not in st.session_state:
-                st.session_state.messages = [
-                    {"role": "assistant", "content": DEFAULT_GREETING}
-                ]
+                history = self.load_history()
+                st.session_state.messages = deque(
+                    [{"role": "assistant", "content": DEFAULT_GREETING}] + history,
+                    maxlen=2 * MAX_CHAT_TURNS
+                )
+            
+            # Model context: recent messages verbatim plus a rolling summary of older ones
+            if "context_messages" not in st.session_state:
+                st.session_state.context_messages = [{"role": "assistant", "content": DEFAULT_GREETING}] + list(st.session_state.messages)[1:][-2 * CHAT_WINDOW_TURNS:]
+            if "chat_summary" not in st.session_state:
+                st.session_state.chat_summary = self.load_summary()
             
             # Initialize travel journal entries
             if "journal_entries" not in st.session_state:
                 st.session_state.journal_entries = []
 
+        def load_history(self):
+            """Load this chat session's saved messages"""
+            try:
+                return get_chat_store().load(st.session_state.chat_session_id, 2 * MAX_CHAT_TURNS)
+            except sqlite3.Error as e:
+                logger.error(f"Error loading chat history: {str(e)}")
+                return []
+
+        def load_summary(self):
+            """Load the saved summary of this chat session's trimmed context"""
+            try:
+                return get_chat_store().load_summary(st.session_state.chat_session_id)
+            except sqlite3.Error as e:
+                logger.error(f"Error loading chat summary: {str(e)}")
+                return ""
+
+        def new_chat(self):
+            """Start a fresh conversation under a new chat ID, so the old link no longer shows new messages"""
+            session_id = uuid.uuid4().hex
+            st.query_params["chat"] = session_id
+            st.session_state.chat_session_id = session_id
+            st.session_state.messages = deque([{"role": "assistant", "content": DEFAULT_GREETING}], maxlen=2 * MAX_CHAT_TURNS)
+            st.session_state.context_messages = [{"role": "assistant", "content": DEFAULT_GREETING}]
+            st.session_state.chat_summary = ""
+            st.session_state.pop("last_prompt", None)
+
+        def save_message(self, role, content):
+            """Append a message to the chat history and persist it"""
+            message = {"role": role, "content": content}
+            st.session_state.messages.append(message)
+            st.session_state.context_messages.append(dict(message))
+            try:
+                get_chat_store().append(st.session_state.chat_session_id, role, content)
+            except sqlite3.Error as e:
+                logger.error(f"Error saving chat message: {str(e)}")
+
         def _initialize_azure(self):
             """Initialize the Azure OpenAI API with the API key and endpoint"""
             try:
-                client = AzureOpenAI(
-                    api_key=st.session_state.azure_api_key,
-                    api_version="2023-05-15",
-                    azure_endpoint=st.session_state.azure_endpoint
-                )
-                return client
+                return get_azure_client(st.session_state.azure_api_key, st.session_state.azure_endpoint)
             except Exception as e:
                 logger.error(f"Error initializing Azure API: {str(e)}")
                 st.error(f"Failed to initialize Azure API: {str(e)}")
                 return None
 
         def get_ai_response(self, messages):
-            """Get a response from the Azure OpenAI API"""
+            """Stream a response from the Azure OpenAI API, yielding text as it arrives"""
             try:
+                payload = [{"role": m["role"], "content": m["content"]} for m in messages]
+                summary = st.session_state.get("chat_summary", "")
+                
+                # Opening questions don't depend on earlier turns, so repeats of the same question can share an answer
+                user_prompts = [m["content"] for m in payload if m["role"] == "user"]
+                cacheable = len(user_prompts) == 1 and not summary
+                if cacheable:
+                    cached = get_prompt_cache().get(user_prompts[0])
+                    if cached:
+                        yield cached
+                        return
+                
                 client = self._initialize_azure()
                 if not client:
-                    return "I'm having trouble connecting to my AI services. Please check your API settings."
+                    yield "I'm having trouble connecting to my AI services. Please check your API settings."
+                    return
                 
                 # Add system message at the beginning if not already present
-                if messages[0]["role"] != "system":
-                    messages.insert(0, {"role": "system", "content": SYSTEM_PROMPT})
+                if payload[0]["role"] != "system":
+                    if summary:
+                        payload.insert(0, {"role": "system", "content": SUMMARY_CONTEXT_TMPL({"summary": summary})})
+                    payload.insert(0, {"role": "system", "content": SYSTEM_PROMPT})
                 
-                response = client.chat.completions.create(
+                stream = client.chat.completions.create(
                     model=AZURE_MODEL,
-                    messages=[{"role": m["role"], "content": m["content"]} for m in messages],
+                    messages=payload,
                     max_tokens=800,
-                    temperature=0.7
+                    temperature=0.7,
+                    stream=True
                 )
-                return response.choices[0].message.content
+                parts = []
+                for chunk in stream:
+                    # Azure can send chunks without choices (e.g. content filter results)
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        parts.append(chunk.choices[0].delta.content)
+                        yield parts[-1]
+                if cacheable and parts:
+                    get_prompt_cache().add(user_prompts[0], "".join(parts))
             except Exception as e:
                 logger.error(f"Error getting AI response: {str(e)}")
-                return f"I encountered an error: {str(e)}"
+                yield f"I encountered an error: {str(e)}"
+
+        def summarize_messages(self, messages):
+            """Condense older chat turns (and any previous summary) into a short summary"""
+            client = self._initialize_azure()
+            if not client:
+                return None
+            transcript = "\n".join(f"{m['role']}: {m['content']}" for m in messages)
+            if st.session_state.chat_summary:
+                transcript = f"Earlier summary: {st.session_state.chat_summary}\n{transcript}"
+            response = client.chat.completions.create(
+                model=AZURE_MODEL,
+                messages=[{"role": "user", "content": SUMMARY_REQUEST_TMPL({"transcript": transcript})}],
+                max_tokens=200,
+                temperature=0.3
+            )
+            return response.choices[0].message.content
+
+        def trim_context(self):
+            """Fold the oldest half of the model context into the summary once it outgrows the window"""
+            context = st.session_state.context_messages
+            if len(context) <= 2 * CHAT_WINDOW_TURNS:
+                return
+            split = len(context) // 2
+            older, st.session_state.context_messages = context[:split], context[split:]
+            try:
+                summary = self.summarize_messages(older)
+                if summary:
+                    st.session_state.chat_summary = summary
+                    get_chat_store().save_summary(st.session_state.chat_session_id, summary)
+            except Exception as e:
+                # Dropping the old turns still keeps the request size bounded
+                logger.error(f"Error summarizing chat history: {str(e)}")
 
         def render_header(self):
             """Render the application header"""
@@ -1820,52 +2204,65 @@ elif page=="🤖 AI ASSISTANCE":
             
             # About section
             st.sidebar.subheader(t("About"))
-            st.sidebar.info(
-                t("NILA is your personal AI travel companion for exploring across the World. Ask about destinations, accommodations, cuisine, cultural norms, and more!")
-            )
+            st.sidebar.info(t(ABOUT_TEXT))
             
-            # Tips section
+            # Tips section; only the tip of the day is translated
             st.sidebar.subheader(t("Travel Tips"))
-            tips = [
-                t("Carry a reusable water bottle and water purification tablets."),
-                t("Learn a few basic Hindi phrases to connect with locals."),
-                t("Respect local customs by dressing modestly at religious sites."),
-                t("Try regional cuisines - India has incredible food diversity!"),
-                t("Consider travel during the cooler months (October-March) for most regions.")
-            ]
-            tip = tips[datetime.now().day % len(tips)]
+            tip = t(TRAVEL_TIPS[datetime.now().day % len(TRAVEL_TIPS)])
             st.sidebar.markdown(f"**{t('Tip of the day:')}** {tip}")
+            
+            # Rotate the chat ID; button callbacks run before the rerun the click triggers
+            st.sidebar.button(t("New chat"), key="new_chat", on_click=self.new_chat)
+
+        def is_duplicate_prompt(self, prompt):
+            """Check for the same prompt submitted again within DUPLICATE_PROMPT_WINDOW, e.g. a double submit"""
+            now = time.monotonic()
+            last = st.session_state.get("last_prompt")
+            st.session_state.last_prompt = (prompt, now)
+            return last is not None and last[0] == prompt and now - last[1] < DUPLICATE_PROMPT_WINDOW
+
+        def render_message(self, message):
+            """Render a single chat message"""
+            if message["role"] == "assistant":
+                st.chat_message("assistant", avatar=ICON_URL).write(message["content"])
+            else:
+                st.chat_message("user").write(message["content"])
 
         def render_chat_interface(self):
             """Render the chat interface with message history"""
-            # Display chat messages
+            # Display chat messages; older ones stay collapsed so only the latest exchange is laid out
             chat_container = st.container()
             with chat_container:
-                for message in st.session_state.messages:
-                    if message["role"] == "assistant":
-                        st.chat_message("assistant", avatar=ICON_URL).write(message["content"])
-                    else:
-                        st.chat_message("user").write(message["content"])
+                messages = list(st.session_state.messages)
+                earlier = messages[:-RECENT_CHAT_MESSAGES]
+                if earlier:
+                    with st.expander(t("Earlier conversation"), expanded=False):
+                        for message in earlier:
+                            self.render_message(message)
+                for message in messages[-RECENT_CHAT_MESSAGES:]:
+                    self.render_message(message)
             
             # Chat input
             user_input = st.chat_input(t("Ask about your India travels..."))
-            if user_input:
+            if user_input and not self.is_duplicate_prompt(user_input):
                 # Add user message to history
-                st.session_state.messages.append({"role": "user", "content": user_input})
+                self.save_message("user", user_input)
                 
                 # Display user message
                 with chat_container:
                     st.chat_message("user").write(user_input)
                     
-                    # Get AI response
-                    with st.spinner(t("Thinking...")):
-                        response = self.get_ai_response(st.session_state.messages.copy())
+                    # Display the AI response as it streams in
+                    response = st.chat_message("assistant", avatar=ICON_URL).write_stream(
+                        self.get_ai_response(st.session_state.context_messages)
+                    )
                     
                     # Add AI response to history
-                    st.session_state.messages.append({"role": "assistant", "content": response})
+                    self.save_message("assistant", response)
                     
-                    # Display AI response
-                    st.chat_message("assistant", avatar=ICON_URL).write(response)
+                    # Fold old turns into the summary only after the reply has streamed, so it never delays the answer
+                    with st.spinner(t("Tidying up the conversation...")):
+                        self.trim_context()
                     
                     # Auto-scroll to bottom (using JavaScript)
                     st.markdown(
@@ -1910,9 +2307,8 @@ elif page=="🤖 AI ASSISTANCE":
                         st.markdown(entry['notes'])
                         
                         # Delete button
-                        if st.button(t("Delete Entry"), key=f"delete_{i}"):
-                            st.session_state.journal_entries.pop(i)
-                            st.rerun()
+                        st.button(t("Delete Entry"), key=f"delete_{i}",
+                                  on_click=st.session_state.journal_entries.pop, args=(i,))
             else:
                 st.info(t("Your journal is empty. Start documenting your India journey!"))
 
@@ -1940,11 +2336,4 @@ elif page=="🤖 AI ASSISTANCE":
 
 
 
-st.sidebar.markdown("""
-<div style="margin-top: 2rem; padding: 1rem; border-top: 1px solid #eee;">
-    <p style="font-size: 0.8rem; color: #666;">
-        Wanderwise AI Travel Planner v2.0<br>
-        &copy; 2025 NUTS co. All rights reserved.
-    </p>
-</div>
-""", unsafe_allow_html=True)
+st.sidebar.markdown(sidebar_footer_html(), unsafe_allow_html=True)
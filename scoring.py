@@ -0,0 +1,20 @@
+try:
+    from numba import njit
+except ImportError:  # numba is optional; scoring falls back to plain NumPy
+    njit = None
+
+
+# Score kernel over arrays of travel times and ratings. It lives in an imported module so the
+# compiled dispatcher is built once per process instead of on every Streamlit rerun.
+def score_places(travel_times, ratings, max_travel_time, weather_quality,
+                 weather_importance, crowd_importance, attractions_importance,
+                 crowd_mult, rating_mult):
+    return (
+        (weather_importance * weather_quality / 10) +
+        (crowd_importance * (1 - travel_times / max_travel_time) * crowd_mult) +
+        (attractions_importance * (ratings / 5) * rating_mult)
+    ) * 10
+
+
+if njit is not None:
+    score_places = njit(cache=True, fastmath=True)(score_places)
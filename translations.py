@@ -1,3 +1,6 @@
+import functools
+
+
 def load_translations():
     translations = {
         "en": {
@@ -1504,3 +1507,25 @@ def load_translations():
 
 }
     return translations
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_translations():
+    # Built once per process; callers must not mutate it
+    return load_translations()
+
+
+@functools.lru_cache(maxsize=4096)
+def translate(text_key, lang_code="en"):
+    translations = _shared_translations()
+    if lang_code in translations and text_key in translations[lang_code]:
+        return translations[lang_code][text_key]
+    return translations["en"].get(text_key, text_key)
+
+
+@functools.lru_cache(maxsize=256)
+def join_labels(labels, lang_code=None):
+    # labels must be a tuple; memoized per (labels, language) like translate
+    if lang_code is not None:
+        labels = (translate(label, lang_code) for label in labels)
+    return ", ".join(labels)